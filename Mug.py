@@ -1,10 +1,28 @@
-import math
+import asyncio
+import struct
+import time
 
 from Temp import Temp
 
+# The mug's temperatures are unsigned 16-bit little-endian integers (hundredths of a degree C)
+_U16LE = struct.Struct("<H")
+# Push event codes sent by the mug when the drink temperature / liquid state changes
+_PUSH_EVENT_DRINK_TEMP = 5
+_PUSH_EVENT_LIQUID_STATE = 8
+# Maps the mug's raw liquid state values to their human-readable status
+_LIQUID_STATES = {
+    1: "Empty",
+    2: "Filling",
+    4: "Cooling",
+    5: "Heating",
+    6: "At Temperature"
+}
+
 # Created using the ever-helpful Ember Mug BT Documentation located here:
 #   https://github.com/orlopau/ember-mug
-class Mug:
+# The cached temperature unit and the values kept by watch_status each need a little state of their
+#   own, which takes the attribute count past pylint's default of 7.
+class Mug:  # pylint: disable=too-many-instance-attributes
     """Class that assists in setting & retrieving various Ember Mug datapoints provided
     the MAC address of the mug and an active connection.
 
@@ -21,17 +39,45 @@ class Mug:
     Returns:
         Mug: Mug class
     """
+    # Fixed set of instance attributes, which saves the per-instance __dict__
+    __slots__ = (
+        "_id", "_client", "_chars", "_temp_unit_cache", "_temp_unit_read_at", "_temp_unit_read",
+        "_watched", "_push_generation", "_on_change"
+    )
+
     # Dictionary holding the various service UUIDs for the various commands to control & read data
-    #   from the Ember Mug.
+    #   from the Ember Mug. These are kept as lowercase strings as that's bleak's canonical form -
+    #   it compares against str(uuid).lower(), so uuid.UUID objects would only add a conversion.
     _service_dict = {
         "battery": "fc540007-236c-4c94-8fa9-944a3e5353fa",
         "current_temp": "fc540002-236c-4c94-8fa9-944a3e5353fa",
         "liquid_state": "fc540008-236c-4c94-8fa9-944a3e5353fa",
         "mug_color": "fc540014-236c-4c94-8fa9-944a3e5353fa",
         "mug_name": "fc540001-236c-4c94-8fa9-944a3e5353fa",
+        "push_events": "fc540012-236c-4c94-8fa9-944a3e5353fa",
         "target_temp": "fc540003-236c-4c94-8fa9-944a3e5353fa",
         "temp_unit": "fc540004-236c-4c94-8fa9-944a3e5353fa"
     }
+    # Note on reads: bleak already reads from the mug rather than the OS cache by default on
+    #   Windows/macOS (use_cached=False), so don't pass use_cached=True - on macOS the cached value
+    #   isn't updated by our own writes (e.g. set_name), so later reads would return stale data.
+    # Range (inclusive) of target temperatures the mug supports, for each temperature unit
+    TARGET_TEMP_RANGES = {
+        "C": (50, 62.5),
+        "F": (120, 145)
+    }
+    # Number of seconds a read temperature unit is trusted before re-reading it from the mug,
+    #   guarding against the unit being changed externally (e.g. by the official app).
+    _temp_unit_ttl = 30
+
+    @classmethod
+    def characteristic_uuids(cls):
+        """Gets the UUIDs of every characteristic the class reads from or writes to.
+
+        Returns:
+            set: Characteristic UUIDs.
+        """
+        return set(cls._service_dict.values())
 
     def __init__(self, mug_id, bleak_client):
         """Constructor that stores the mug MAC address and the Bleak client used
@@ -43,8 +89,37 @@ class Mug:
         """
         self._id = mug_id
         self._client = bleak_client
+        # resolve each characteristic once up front so bleak doesn't have to look it up by UUID
+        #   on every read/write (falling back to the UUID if the mug doesn't expose it)
+        self._chars = {
+            name: bleak_client.services.get_characteristic(uuid) or uuid
+            for name, uuid in self._service_dict.items()
+        }
+        self._temp_unit_cache = None
+        self._temp_unit_read_at = 0.0
+        # in-flight read of the temperature unit, shared by anything wanting it at the same time
+        self._temp_unit_read = None
+        # raw values kept while watch_status is active, by characteristic name, until the mug says
+        #   they've changed (None when not watching)
+        self._watched = None
+        # bumped on every relevant push event, so a read that raced one isn't kept
+        self._push_generation = 0
+        self._on_change = None
 
     # Defining our getters and setters
+    @property
+    async def battery(self):
+        """Retrieves both the current battery percentage and battery state with a single read.
+
+        Returns:
+            tuple: Formatted battery percentage and whether or not the mug is charging.
+        """
+        battery_data = await self._client.read_gatt_char(self._chars['battery'])
+        return (
+            f"{battery_data[0]:.1f}%",
+            "Charging" if battery_data[1] == 1 else "Not Charging"
+        )
+
     @property
     async def battery_percent(self):
         """Retrieves the current battery percentage.
@@ -52,7 +127,7 @@ class Mug:
         Returns:
             str: Formatted battery percentage.
         """
-        battery_data = await self._client.read_gatt_char(self._service_dict['battery'])
+        battery_data = await self._client.read_gatt_char(self._chars['battery'])
         return f"{battery_data[0]:.1f}%"
 
     @property
@@ -62,7 +137,7 @@ class Mug:
         Returns:
             str: Whether or not the mug is charging.
         """
-        battery_data = await self._client.read_gatt_char(self._service_dict['battery'])
+        battery_data = await self._client.read_gatt_char(self._chars['battery'])
         return "Charging" if battery_data[1] == 1 else "Not Charging"
 
     @property
@@ -72,7 +147,7 @@ class Mug:
         Returns:
             tuple: RGBA tuple containing the color details.
         """
-        color_data = await self._client.read_gatt_char(self._service_dict['mug_color'])
+        color_data = await self._client.read_gatt_char(self._chars['mug_color'])
         # returns rgba tuple
         return (color_data[0], color_data[1], color_data[2], color_data[3])
 
@@ -85,15 +160,81 @@ class Mug:
             int/float: The current temp. Can either be a float or an int depending 
             on the temperature.
         """
-        raw_temp_data = await self._client.read_gatt_char(self._service_dict['current_temp'])
+        raw_temp_data = await self._read_watched('current_temp')
         # to 'convert' the uint16 format to float celsius we divide by 100
-        celsius_float = int.from_bytes(raw_temp_data, byteorder="little") * .01
+        celsius_float = _U16LE.unpack(raw_temp_data)[0] * .01
         # also need to get the unit to determine if it's in C or F
-        if await self.temp_unit == "C":
+        if await self._get_temp_unit() == "C":
             return f"{celsius_float:.2f}"
         # we need to convert from C into F
         return f"{Temp.to_fahrenheit(celsius_float):.2f}"
 
+    async def watch_status(self, on_change=None):
+        """Subscribes to the mug's push events so that `current_temp` and `status` only read
+        from the mug when it reports that the drink temperature or liquid state has changed,
+        rather than on every call.
+
+        Args:
+            on_change (callable, optional): Called with this mug whenever the mug reports the
+            drink temperature or liquid state has changed. Defaults to None.
+        """
+        if self._watched is not None:
+            return
+        self._on_change = on_change
+        await self._client.start_notify(self._chars['push_events'], self._handle_push_event)
+        # anything read before now may already be out of date
+        self._push_generation += 1
+        self._watched = {}
+
+    async def unwatch_status(self):
+        """Stops the push events started by `watch_status`, going back to reading the current
+        temperature and liquid state on every call.
+        """
+        if self._watched is None:
+            return
+        await self._client.stop_notify(self._chars['push_events'])
+        self._watched = None
+        self._on_change = None
+
+    def _handle_push_event(self, _sender, data):
+        """Handles an event pushed by the mug, forgetting the kept drink temperature / liquid
+        state when the mug reports it has changed so that the next call reads it again.
+
+        Args:
+            _sender (BleakGATTCharacteristic): Characteristic that sent the notification.
+            data (bytearray): Raw event data, the first byte being the event code.
+        """
+        if data[0] == _PUSH_EVENT_DRINK_TEMP:
+            changed = 'current_temp'
+        elif data[0] == _PUSH_EVENT_LIQUID_STATE:
+            changed = 'liquid_state'
+        else:
+            return
+        self._push_generation += 1
+        if self._watched is not None:
+            self._watched.pop(changed, None)
+        if self._on_change is not None:
+            self._on_change(self)
+
+    async def _read_watched(self, char_name):
+        """Reads a characteristic from the mug, reusing the value kept by `watch_status` until the
+        mug reports that it has changed.
+
+        Args:
+            char_name (str): Name of the characteristic in `_service_dict`.
+
+        Returns:
+            bytearray: Raw characteristic data.
+        """
+        if self._watched is not None and char_name in self._watched:
+            return self._watched[char_name]
+        generation = self._push_generation
+        data = await self._client.read_gatt_char(self._chars[char_name])
+        # only keep the value if no push event arrived mid-read, as it may already be stale
+        if self._watched is not None and generation == self._push_generation:
+            self._watched[char_name] = data
+        return data
+
     @property
     async def status(self):
         """Retrieves the liquid state of the mug, which is pretty much the overall mug status, as
@@ -108,20 +249,8 @@ class Mug:
         Returns:
             str: The mug status.
         """
-        raw_liquid_state = await self._client.read_gatt_char(self._service_dict['liquid_state'])
-        match raw_liquid_state[0]:
-            case 1:
-                return "Empty"
-            case 2:
-                return "Filling"
-            case 4:
-                return "Cooling"
-            case 5:
-                return "Heating"
-            case 6:
-                return "At Temperature"
-            case _:
-                return "Unknown"
+        raw_liquid_state = await self._read_watched('liquid_state')
+        return _LIQUID_STATES.get(raw_liquid_state[0], "Unknown")
 
     @property
     async def name(self):
@@ -130,7 +259,7 @@ class Mug:
         Returns:
             str: The name of the mug.
         """
-        raw_name = await self._client.read_gatt_char(self._service_dict['mug_name'])
+        raw_name = await self._client.read_gatt_char(self._chars['mug_name'])
         return raw_name.decode("ascii")
 
     # Note that some `setter`s are not compatible with async methods currently...
@@ -156,11 +285,11 @@ class Mug:
             raise ValueError("The name is invalid - spaces are not supported")
         if len(encoded_name) > 14:
             raise ValueError(
-                f"Name is too long (must be smaller than 14 bytes). Your name [{value}] "+
-                "was {len(encoded_name)} bytes."
+                f"Name is too long (must be smaller than 14 bytes). Your name [{value}] "
+                f"was {len(encoded_name)} bytes."
             )
         await self._client.write_gatt_char(
-            self._service_dict['mug_name'],
+            self._chars['mug_name'],
             encoded_name
         )
 
@@ -172,12 +301,12 @@ class Mug:
             int/float: The target temperature. Can either be a float or an int depending 
             on the temperature.
         """
-        raw_temp_data = await self._client.read_gatt_char(self._service_dict['target_temp'])
+        raw_temp_data = await self._client.read_gatt_char(self._chars['target_temp'])
         # to 'convert' the uint16 format to float celsius we divide by 100
-        celsius_float = int.from_bytes(raw_temp_data, byteorder="little") * .01
+        celsius_float = _U16LE.unpack(raw_temp_data)[0] * .01
         # also need to get the unit to determine if it's in C or F
-        if await self.temp_unit == "C":
-            return f"{celsius_float:.2f}".format()
+        if await self._get_temp_unit() == "C":
+            return f"{celsius_float:.2f}"
         # we need to convert from C into F
         return f"{Temp.to_fahrenheit(celsius_float):.2f}"
 
@@ -198,19 +327,22 @@ class Mug:
         """
         value_to_set = value
         # need to get the unit to determine if it's in C or F so we can convert appropriately
-        current_temp_unit = await self.temp_unit
+        current_temp_unit = await self._get_temp_unit()
         # add some safeguards here...
-        if current_temp_unit == "F" and (value_to_set > 145 or value_to_set < 120):
-            raise ValueError(f"Temperature {value_to_set} deg F out of range 120 < x < 145")
-        if current_temp_unit == "C" and (value_to_set > 62.5 or value_to_set < 50):
-            raise ValueError(f"Temperature {value_to_set} deg C out of range 50 < x < 62.5")
+        low, high = self.TARGET_TEMP_RANGES[current_temp_unit]
+        if value_to_set > high or value_to_set < low:
+            raise ValueError(
+                f"Temperature {value_to_set} deg {current_temp_unit} out of range "
+                f"{low} < x < {high}"
+            )
 
         if current_temp_unit == "F":
             value_to_set = Temp.to_celsius(value_to_set)
         await self._client.write_gatt_char(
-            self._service_dict['target_temp'],
+            self._chars['target_temp'],
             # to 'convert' non-int C to the uint16 format required we multiply by 100 and floor it
-            int.to_bytes(math.floor(value_to_set * 100), length=2, byteorder="little")
+            #   (int() floors here, as the temperature is always positive)
+            _U16LE.pack(int(value_to_set * 100))
         )
         return f"{value:.2f}"
 
@@ -221,8 +353,49 @@ class Mug:
         Returns:
             str: C for Celsius, F for Fahrenheit.
         """
-        raw_temp_unit = await self._client.read_gatt_char(self._service_dict['temp_unit'])
-        return "C" if raw_temp_unit[0] == 0 else "F"
+        return await self._get_temp_unit(force=True)
+
+    async def _read_temp_unit(self):
+        """Reads the temperature unit from the mug and caches it.
+
+        Returns:
+            str: C for Celsius, F for Fahrenheit.
+        """
+        raw_temp_unit = await self._client.read_gatt_char(self._chars['temp_unit'])
+        self._temp_unit_cache = "C" if raw_temp_unit[0] == 0 else "F"
+        self._temp_unit_read_at = time.monotonic()
+        return self._temp_unit_cache
+
+    def _clear_temp_unit_read(self, _read):
+        """Forgets the in-flight temperature unit read once it has finished.
+
+        Args:
+            _read (asyncio.Future): The finished read.
+        """
+        self._temp_unit_read = None
+
+    async def _get_temp_unit(self, force=False):
+        """Gets the temperature unit, only reading it from the mug if it has not been read
+        recently (or if forced to), saving a BLE round-trip on every temperature read/write.
+
+        Args:
+            force (bool, optional): Always read the unit from the mug. Defaults to False.
+
+        Returns:
+            str: C for Celsius, F for Fahrenheit.
+        """
+        # a read that's already in flight is always joined (e.g. when several reads are gathered
+        #   at once), both to avoid issuing another one and so that nothing uses the cached unit
+        #   while a newer one is on its way
+        if (
+            not force and self._temp_unit_read is None and self._temp_unit_cache is not None and
+            time.monotonic() - self._temp_unit_read_at <= self._temp_unit_ttl
+        ):
+            return self._temp_unit_cache
+        if self._temp_unit_read is None:
+            self._temp_unit_read = asyncio.ensure_future(self._read_temp_unit())
+            self._temp_unit_read.add_done_callback(self._clear_temp_unit_read)
+        return await asyncio.shield(self._temp_unit_read)
 
     async def set_temp_unit(self, value):
         """Sets the temperature unit (Fahrenheit or Celsius) the mug is using.
@@ -241,7 +414,10 @@ class Mug:
 
         value_to_set = 0 if value == "C" else 1
         await self._client.write_gatt_char(
-            self._service_dict['temp_unit'], 
+            self._chars['temp_unit'], 
             int.to_bytes(value_to_set, length=1)
         )
+        # keep the cached unit in line with what we just wrote
+        self._temp_unit_cache = value
+        self._temp_unit_read_at = time.monotonic()
         return value
@@ -11,7 +11,7 @@ class Temp:
         Returns:
             float/int: The Fahrenheit value corresponding to the provided Celsius value.
         """
-        return (c_value * 9 / 5) + 32
+        return c_value * 1.8 + 32
 
     @staticmethod
     def to_celsius(f_value):
@@ -23,4 +23,5 @@ class Temp:
         Returns:
             float/int: The Celsius value corresponding to the provided Fahrenheit value.
         """
-        return (f_value - 32) * 5 / 9
+        # 5 / 9, precomputed
+        return (f_value - 32) * 0.5555555555555556
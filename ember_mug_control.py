@@ -6,62 +6,294 @@ for arguments to then connect to and control the appropriate Ember Mug device.
 
 import argparse
 import asyncio
-import re
+import contextlib
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from bleak import BleakClient, BleakScanner
-from bleak.backends.device import BLEDevice
-from bleak.backends.scanner import AdvertisementData
-from bleak.exc import BleakDeviceNotFoundError
 from Mug import Mug
 
-# list to ensure we've not seen the device before
-seen_devices = []
+# bleak is imported where it's used rather than here, as importing it takes a noticeable amount of
+#   time that we'd rather not spend on things like `--help` or a mistyped argument
+if TYPE_CHECKING:
+    from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
 
-def device_found(device: BLEDevice, _advertisement_data: AdvertisementData):
-    """_summary_
+# number of attempts made to connect to a mug, and the seconds to wait between them, as the first
+#   attempt often fails with a transient BlueZ/CoreBluetooth error
+_CONNECT_ATTEMPTS = 3
+_CONNECT_RETRY_DELAY_SECONDS = 0.5
+# directory holding the per-mug service caches
+_CACHE_DIR = Path.home() / ".cache" / "ember-mug"
+
+# set to ensure we've not seen the device before
+_seen_addrs = set()
+# list of the devices (BLEDevice) we've seen, in the order they're numbered for the user
+_seen_order = []
+
+async def ainput(prompt):
+    """ Prompts the user for input without blocking the event loop, so bleak can keep servicing
+    the connection (notifications, disconnects, etc.) while the user is typing.
 
     Args:
-        device (BLEDevice): _description_
-        advertisement_data (AdvertisementData): _description_
+        prompt (str): Prompt to display.
+
+    Returns:
+        str: The user's input.
     """
-    ember_pattern = re.compile("ember", flags=re.IGNORECASE)
-    if device.address not in seen_devices and ember_pattern.search(str(device)) is not None:
+    loop = asyncio.get_running_loop()
+    result = loop.create_future()
+
+    def resolve(resolver, value):
+        # the prompt may have been cancelled (e.g. Ctrl+C) while the user was typing
+        if not result.done():
+            resolver(value)
+
+    def read_input():
+        try:
+            loop.call_soon_threadsafe(resolve, result.set_result, input(prompt))
+        # hand every error (EOF, undecodable input, closed stdin, ...) back to the prompt's
+        #   caller, as otherwise it would wait on the prompt forever
+        except BaseException as ex: # pylint: disable=broad-exception-caught
+            loop.call_soon_threadsafe(resolve, result.set_exception, ex)
+
+    # a daemon thread (rather than asyncio.to_thread) so a pending prompt never holds up exiting
+    threading.Thread(target=read_input, daemon=True).start()
+    return await result
+
+async def prompt_number(prompt, parse, low=None, high=None, answer=None):
+    """ Prompts the user for a number, prompting again until they enter a valid one.
+
+    Args:
+        prompt (str): Prompt to display.
+        parse (callable): Parses the user's input into a number, e.g. int or float.
+        low (int/float, optional): Smallest number allowed. Defaults to None (no limit).
+        high (int/float, optional): Largest number allowed. Defaults to None (no limit).
+        answer (Awaitable, optional): Pending answer to an already-displayed prompt, to use
+        for the first attempt. Defaults to None.
+
+    Returns:
+        int/float: The number entered by the user.
+    """
+    while True:
+        text = await (answer if answer is not None else ainput(prompt))
+        answer = None
+        try:
+            value = parse(text)
+        except ValueError:
+            print(f"{text!r} is not a valid number, please try again.")
+            continue
+        if (low is not None and value < low) or (high is not None and value > high):
+            print(f"Please enter a number from {low} to {high}.")
+            continue
+        return value
+
+def device_found(device: "BLEDevice", _advertisement_data: "AdvertisementData"):
+    """ Scanner callback that lists out any Ember Mugs we haven't seen yet.
+
+    Args:
+        device (BLEDevice): Device the advertisement came from.
+        advertisement_data (AdvertisementData): Data that was advertised.
+
+    Returns:
+        Boolean: True if the device is an Ember Mug we hadn't seen before.
+    """
+    if device.address in _seen_addrs:
+        return False
+    # no regex needed to spot an Ember - a plain case-insensitive substring check on the name does
+    #   it, and it avoids formatting the whole device for every advertisement
+    if "ember" in (device.name or "").casefold():
+        # bleak runs this callback on the event loop and there's no await between the check
+        #   above and recording the mug here, so back-to-back adverts from the same mug can't
+        #   both get through (it's recorded before printing for the same reason)
+        _seen_addrs.add(device.address)
+        # keep the whole device so connecting to it doesn't need to scan for it all over again
+        _seen_order.append(device)
+        device_str = str(device)
         print()
-        print(f"[{len(seen_devices) + 1}]: { device}")
-        print("".join('-'*len(str(device))))
+        print(f"[{len(_seen_order)}]: {device_str}")
+        print('-' * len(device_str))
         # print(advertisement_data)
-        seen_devices.append(device.address)
+        return True
+    return False
 
 async def mug_find(num_seconds):
     """ Scans and displays any found Ember Mugs for the user to select to start interacting
     with.
 
+    The user is asked to pick as soon as the first mug shows up, rather than after the full scan
+    time. Scanning (and listing any other mugs found) carries on until they pick or the scan time
+    runs out.
+
     Args:
-        num_seconds (int): Number of seconds to scan for mugs.
+        num_seconds (int): Maximum number of seconds to scan for mugs.
 
     Returns:
         Boolean: False if no mugs are found, or if the user exits without selecting a mug.
     """
-    scanner = BleakScanner(detection_callback=device_found)
+    from bleak import BleakScanner # pylint: disable=import-outside-toplevel
+
+    selection_prompt = "Find your mug? Enter the number for it here, or 0 for no match: "
+    loop = asyncio.get_running_loop()
+    # set whenever the scanner lists out a new mug
+    mug_found = asyncio.Event()
+
+    def on_detection(device, advertisement_data):
+        if device_found(device, advertisement_data):
+            mug_found.set()
+
+    # each scan lists (and numbers) the mugs it finds afresh
+    _seen_addrs.clear()
+    _seen_order.clear()
+    scanner = BleakScanner(detection_callback=on_detection)
+    scan_end = loop.time() + num_seconds
     await scanner.start()
-    await asyncio.sleep(num_seconds)
-    await scanner.stop()
+    try:
+        await asyncio.wait_for(mug_found.wait(), timeout=num_seconds)
+        # keep scanning while the user picks, so any other mugs still get listed
+        selection = asyncio.ensure_future(ainput(selection_prompt))
+        await asyncio.wait([selection], timeout=max(scan_end - loop.time(), 0))
+    except asyncio.TimeoutError:
+        selection = None
+    finally:
+        # always stop scanning before anything connects, as BlueZ can fail to connect while
+        #   a scan is running
+        await scanner.stop()
 
-    if len(seen_devices) == 0:
+    if selection is None:
         print("No Ember Mug devices found.")
         return False
-    selected_mug = int(input(
-        "Find your mug? Enter the number for it here, or 0 for no match: "
-    ))
-    if selected_mug <= 0 or selected_mug > len(seen_devices):
+    selected_mug = await prompt_number(
+        selection_prompt, int, 0, len(_seen_order), answer=selection
+    )
+    if selected_mug == 0:
         return False
-    # now we've got the right mac address, we need to figure out what the user wants to do
+    # now we've got the right mug, we need to figure out what the user wants to do
     #   with their mug.
-    selected_mug_addr = seen_devices[selected_mug - 1]
-    print(f"You've selected: {selected_mug_addr}")
-    await interactive_mug_control(selected_mug_addr)
+    selected_mug_device = _seen_order[selected_mug - 1]
+    print(f"You've selected: {selected_mug_device.address}")
+    await interactive_mug_control(selected_mug_device)
+
+def _service_cache_path(mug_id):
+    """ Gets the path of the service cache file for the provided mug.
+
+    Args:
+        mug_id (string): MAC Address of the mug.
+
+    Returns:
+        Path: Path to the mug's service cache file.
+    """
+    # colons aren't valid in Windows filenames
+    return _CACHE_DIR / f"{mug_id.replace(':', '-').lower()}.json"
 
-async def mug_control(mug_id, command, command_arg = False):
+def load_cached_services(mug_id):
+    """ Loads the UUIDs of the mug's GATT services that hold the characteristics we use, as
+    saved by a previous connection.
+
+    Args:
+        mug_id (string): MAC Address of the mug.
+
+    Returns:
+        list: Service UUIDs, or None if nothing (valid) has been cached for the mug.
+    """
+    try:
+        with open(_service_cache_path(mug_id), encoding="utf-8") as cache_file:
+            return json.load(cache_file)["services"] or None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_cached_services(mug_id, client):
+    """ Saves the UUIDs of the GATT services that hold the characteristics we use so later
+    connections only need to discover those services.
+
+    Args:
+        mug_id (string): MAC Address of the mug.
+        client (BleakClient): Bleak client connected to the mug, with services discovered.
+    """
+    char_uuids = Mug.characteristic_uuids()
+    service_uuids = sorted({
+        char.service_uuid for char in client.services.characteristics.values()
+        if char.uuid in char_uuids
+    })
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_service_cache_path(mug_id), "w", encoding="utf-8") as cache_file:
+            json.dump({"services": service_uuids}, cache_file)
+    except OSError:
+        # the cache is purely an optimization, so carry on without it
+        pass
+
+def clear_cached_services(mug_id):
+    """ Removes the service cache for the provided mug, so the next connection discovers all of
+    its services again.
+
+    Args:
+        mug_id (string): MAC Address of the mug.
+    """
+    _service_cache_path(mug_id).unlink(missing_ok=True)
+
+@contextlib.asynccontextmanager
+async def connected_client(mug_device):
+    """ Connects to the provided mug, reusing any GATT services bleak has already discovered
+    for it instead of re-discovering them on every connect. The Ember Mug's services are fixed,
+    so the cached copy stays valid (unless a firmware update changes them - if reads start
+    failing after one, clear the OS Bluetooth cache / re-pair the mug).
+
+    After the first connection, the services we actually use are also remembered on disk so
+    later connections (including separate runs of the application) only discover those. That
+    cache is dropped if talking to the mug fails.
+
+    Connecting is retried a few times before giving up, as transient failures are common.
+
+    Args:
+        mug_device (BLEDevice/string): The mug to connect to, either as found by a scan (which
+        saves bleak from scanning for it again) or by its MAC Address.
+
+    Yields:
+        BleakClient: Bleak client connected to the mug.
+    """
+    from bleak import BleakClient # pylint: disable=import-outside-toplevel
+    # pylint: disable-next=import-outside-toplevel
+    from bleak.exc import BleakDeviceNotFoundError, BleakError
+
+    mug_id = getattr(mug_device, "address", mug_device)
+    cached_services = load_cached_services(mug_id)
+    client = BleakClient(
+        mug_device,
+        services=cached_services,
+        winrt={"use_cached_services": True}
+    )
+    for attempt in range(1, _CONNECT_ATTEMPTS + 1):
+        try:
+            await client.connect(dangerous_use_bleak_cache=True)
+            break
+        except BleakDeviceNotFoundError:
+            # bleak has already spent its whole timeout looking for the mug, so retrying would
+            #   only repeat that wait
+            raise
+        except (BleakError, asyncio.TimeoutError):
+            if attempt == _CONNECT_ATTEMPTS:
+                raise
+            await asyncio.sleep(_CONNECT_RETRY_DELAY_SECONDS)
+    try:
+        if cached_services is None:
+            save_cached_services(mug_id, client)
+        # the bond is kept between connections (unless asked to unpair), and bleak returns early
+        #   when the mug is already paired, so this only does any work the first time. The OS is
+        #   asked every time rather than remembering it ourselves, as the bond can be removed
+        #   outside of the application.
+        await client.pair()
+        yield client
+    except BleakError:
+        # the cached services may no longer match the mug, so discover them afresh next time
+        clear_cached_services(mug_id)
+        raise
+    finally:
+        await client.disconnect()
+
+async def mug_control(mug_id, command, command_arg = False, unpair = False):
     """ Connects to the provided mug and runs the selected command, printing the result to
     the screen.
 
@@ -70,94 +302,191 @@ async def mug_control(mug_id, command, command_arg = False):
         command (string): Name of the command to execute against the mug.
         command_arg (bool, string, int): Argument applying to the selected command. 
         Defaults to False.
+        unpair (bool): Whether to unpair from the mug once the command has run. Defaults to
+        False, as keeping the pairing makes later connections quicker.
     """
-    async with BleakClient(mug_id) as client:
-        await client.pair()
+    async with connected_client(mug_id) as client:
         mug = Mug(mug_id, client)
+        await mug_command(mug, command, command_arg)
+        if unpair:
+            # unpair while still connected, as doing so afterwards needs another round-trip
+            await client.unpair()
 
-        if command == 'status':
-            temp_unit = await mug.temp_unit
+async def mug_command(mug, command, command_arg = False):
+    """ Runs the selected command against an already-connected mug, printing the result to
+    the screen.
 
-            print(f"Mug Name: {await mug.name} | Status: {await mug.status}")
-            print(f"Battery: {await mug.battery_percent} | State: {await mug.battery_state}")
-            print(
-                f"Current Temp: {await mug.current_temp} deg {temp_unit} | "+
-                f"Target: {await mug.target_temp} deg {temp_unit}"
+    Args:
+        mug (Mug): Mug to run the command against.
+        command (string): Name of the command to execute against the mug.
+        command_arg (bool, string, int): Argument applying to the selected command. 
+        Defaults to False.
+    """
+    await _COMMANDS[command](mug, command_arg)
+
+async def _cmd_status(mug, _command_arg):
+    """ Prints out the status of the mug.
+
+    Args:
+        mug (Mug): Mug to get the status of.
+        _command_arg (bool): Unused.
+    """
+    # the reads are independent, so issue them all at once (the temperature reads share the
+    #   single temperature unit read rather than each making their own)
+    temp_unit, name, status, battery, current_temp, target_temp = await asyncio.gather(
+        mug.temp_unit, mug.name, mug.status, mug.battery, mug.current_temp, mug.target_temp
+    )
+    battery_percent, battery_state = battery
+
+    print(f"Mug Name: {name} | Status: {status}")
+    print(f"Battery: {battery_percent} | State: {battery_state}")
+    print(
+        f"Current Temp: {current_temp} deg {temp_unit} | "+
+        f"Target: {target_temp} deg {temp_unit}"
+    )
+
+async def _cmd_watch(mug, _command_arg):
+    """ Prints the current temperature and status of the mug, then again each time the mug
+    reports that either has changed, until interrupted.
+
+    Args:
+        mug (Mug): Mug to watch.
+        _command_arg (bool): Unused.
+    """
+    changed = asyncio.Event()
+    await mug.watch_status(lambda _mug: changed.set())
+    try:
+        while True:
+            changed.clear()
+            temp_unit, current_temp, status = await asyncio.gather(
+                mug.temp_unit, mug.current_temp, mug.status
             )
-        elif command == 'set-name':
-            print(f"Setting the name of your mug to {command_arg}...")
-            await mug.set_name(command_arg)
-            print("Successfully set the name.")
-        elif command == 'set-target-temp':
-            temp_unit = await mug.temp_unit
-            print(f"Setting the target temperature of your mug to {command_arg} deg {temp_unit}...")
-            await mug.set_target_temp(command_arg)
-            print("Successfully set the temperature unit.")
-        elif command == 'set-temp-unit':
-            print(f"Setting the temperature unit of your mug to {command_arg}")
-            await mug.set_temp_unit(command_arg)
-            print("Successfully set the temperature.")
+            print(f"Current Temp: {current_temp} deg {temp_unit} | Status: {status}")
+            await changed.wait()
+    finally:
+        await mug.unwatch_status()
 
-    await client.unpair()
+async def _cmd_set_name(mug, name):
+    """ Sets the name of the mug.
 
-async def interactive_mug_control(mac_addr):
-    """ Collects the arguments from the user to then supply to the mug to perform various 
-    operations, such as checking the status or setting various operating parameters.
+    Args:
+        mug (Mug): Mug to set the name of.
+        name (str): Desired name for the mug.
+    """
+    print(f"Setting the name of your mug to {name}...")
+    await mug.set_name(name)
+    print("Successfully set the name.")
+
+async def _cmd_set_target_temp(mug, temp):
+    """ Sets the target temperature of the mug.
 
     Args:
-        mac_addr (str): MAC Address of the mug to connect to.
+        mug (Mug): Mug to set the target temperature of.
+        temp (int/float): Desired target temperature, in the mug's temperature unit.
+    """
+    temp_unit = await mug.temp_unit
+    print(f"Setting the target temperature of your mug to {temp} deg {temp_unit}...")
+    await mug.set_target_temp(temp)
+    print("Successfully set the temperature.")
+
+async def _cmd_set_temp_unit(mug, unit):
+    """ Sets the temperature unit of the mug.
+
+    Args:
+        mug (Mug): Mug to set the temperature unit of.
+        unit (str): Desired temperature unit (C or F).
+    """
+    print(f"Setting the temperature unit of your mug to {unit}")
+    await mug.set_temp_unit(unit)
+    print("Successfully set the temperature unit.")
+
+# Maps each mug command to the function that runs it
+_COMMANDS = {
+    'status': _cmd_status,
+    'watch': _cmd_watch,
+    'set-name': _cmd_set_name,
+    'set-target-temp': _cmd_set_target_temp,
+    'set-temp-unit': _cmd_set_temp_unit
+}
+# Maps each mug command that takes an argument to the name of that command line argument
+_COMMAND_ARGS = {
+    'set-name': 'name',
+    'set-target-temp': 'temp',
+    'set-temp-unit': 'unit'
+}
+
+async def interactive_mug_control(mug_device):
+    """ Connects to the mug once, then collects the arguments from the user to supply to the mug
+    to perform various operations, such as checking the status or setting various operating
+    parameters. Keeps prompting (over the same connection) until the user chooses to exit.
+
+    Args:
+        mug_device (BLEDevice/str): The mug to connect to, either as found by a scan or by its
+        MAC Address.
 
     Returns:
         Boolean: Returns false if the user no longer wants to continue.
     """
-    print("Now that you've selected the mug you'd like to interact with, what do you want to do?")
-    print("  1) Check status")
-    print("  2) Set mug name")
-    print("  3) Set the target temperature")
-    print("  4) Set the temperature unit")
-    print("  5) Exit")
-    selected_control = input("Your choice?\n")
-    match(selected_control):
-        case "1":
-            await mug_control(mac_addr, 'status')
-        case "2":
-            selected_name = input(
-                "Please enter your mug's name. It cannot contain spaces and must be shorter "+
-                "than 14 bytes/characters\n"
+    async with connected_client(mug_device) as client:
+        mug = Mug(client.address, client)
+        while True:
+            print(
+                "Now that you've selected the mug you'd like to interact with, "+
+                "what do you want to do?"
             )
-            await mug_control(mac_addr, 'set-name', selected_name)
-        case "3":
-            # really need to see what the unit is before we prompt...
-            client = BleakClient(mac_addr)
+            print("  1) Check status")
+            print("  2) Set mug name")
+            print("  3) Set the target temperature")
+            print("  4) Set the temperature unit")
+            print("  5) Exit")
+            selected_control = await ainput("Your choice?\n")
+            # bad values (e.g. a temperature out of range) shouldn't end the session
             try:
-                await client.connect()
-                mug = Mug(mac_addr, client)
-                current_temp_unit = await mug.temp_unit
-            except Exception as e:
-                print(f"Something bad happened while getting the temperature unit: {e}")
-            finally:
-                await client.disconnect()
-            desired_temp = float(input(
-                f"What is the temperature (in {current_temp_unit}) you would like to target?\n"
-            ))
-            await mug_control(mac_addr, 'set-target-temp', desired_temp)
-        case "4":
-            selected_unit = input(
-                "What is the temperature unit you would like to use? (Select C or F)\n"
-            )
-            await mug_control(mac_addr, 'set-temp-unit', selected_unit)
-        case "5":
-            return False
-        case _:
-            print("You've selected an invalid option, please try again.")
-            await interactive_mug_control(mac_addr)
+                match(selected_control):
+                    case "1":
+                        await mug_command(mug, 'status')
+                    case "2":
+                        selected_name = await ainput(
+                            "Please enter your mug's name. It cannot contain spaces and must be "+
+                            "shorter than 14 bytes/characters\n"
+                        )
+                        await mug_command(mug, 'set-name', selected_name)
+                    case "3":
+                        # really need to see what the unit is before we prompt...
+                        current_temp_unit = await mug.temp_unit
+                        desired_temp = await prompt_number(
+                            f"What is the temperature (in {current_temp_unit}) you would like to "+
+                            "target?\n",
+                            float,
+                            *Mug.TARGET_TEMP_RANGES[current_temp_unit]
+                        )
+                        await mug_command(mug, 'set-target-temp', desired_temp)
+                    case "4":
+                        selected_unit = await ainput(
+                            "What is the temperature unit you would like to use? (Select C or F)\n"
+                        )
+                        await mug_command(mug, 'set-temp-unit', selected_unit)
+                    case "5":
+                        return False
+                    case _:
+                        print("You've selected an invalid option, please try again.")
+            except ValueError as ex:
+                print(f"Unable to do that: {ex}")
 
-def main():
-    """ Generates all the command line syntax / helper docs and collects the arguments to
-    then pass to the appropriate function (depending on if the user wanted to scan or simply
-    connect to a device).
+def _build_parser(argv):
+    """ Generates all the command line syntax / helper docs. Only the parts of the syntax that
+    can apply to the provided arguments are built, e.g. the connect commands are skipped when
+    scanning.
+
+    Args:
+        argv (list): Command line arguments (without the program name).
+
+    Returns:
+        ArgumentParser: Parser for the command line arguments.
     """
-    # Define and collect our command line arguments
+    # the top-level parser only has -h, so the first non-option argument is the mode
+    mode = next((arg for arg in argv if not arg.startswith('-')), None)
+
     parser = argparse.ArgumentParser(
         prog="EmberMugController",
         description="Connects to and controls Ember Mugs"
@@ -173,12 +502,39 @@ def main():
         'connect',
         help='Connect to the Ember Mug with the provided MAC address'
     )
+    if mode != 'scan':
+        _add_connect_arguments(subparser_connect)
+    # Scan operation parser
+    subparser_scan = subparsers.add_parser(
+        'scan',
+        help='Scan for and output MAC addresses of Ember Mugs to connect to',
+    )
+    subparser_scan.add_argument(
+        '--time',
+        type=int,
+        default=5,
+        help="Maximum number of seconds to poll for devices (a mug can be picked as soon as "+
+        "it's listed). Default is 5."
+    )
+    return parser
+
+def _add_connect_arguments(subparser_connect):
+    """ Adds the arguments and mug commands for the connect mode.
+
+    Args:
+        subparser_connect (ArgumentParser): Parser for the connect mode.
+    """
     subparser_connect.add_argument(
         '--id',
         type=str,
         required=True,
         help="The MAC address of the mug to connect to. Required if 'mode' is connect."
     )
+    subparser_connect.add_argument(
+        '--unpair',
+        action='store_true',
+        help="Unpair from the mug after running the command. By default the pairing is kept."
+    )
     # Starting subparser for the various mug commands
     subparser_connect_cmds = subparser_connect.add_subparsers(
         title='Mug commands',
@@ -200,6 +556,11 @@ def main():
         'status',
         help='Display status of the Ember Mug'
     )
+    # Watch parser
+    subparser_connect_cmds.add_parser(
+        'watch',
+        help='Display the temperature and status of the Ember Mug as they change'
+    )
     # Set target temp parser
     subparser_connect_set_temp = subparser_connect_cmds.add_parser(
         'set-target-temp',
@@ -207,6 +568,7 @@ def main():
     )
     subparser_connect_set_temp.add_argument(
         '--temp',
+        type=float,
         help='Target temperature to set. Required.'
     )
     # Set temperature unit parser
@@ -218,34 +580,29 @@ def main():
         '--unit',
         help='Unit of temperature to set (C or F). Required.'
     )
-    # Scan operation parser
-    subparser_scan = subparsers.add_parser(
-        'scan',
-        help='Scan for and output MAC addresses of Ember Mugs to connect to',
-    )
-    subparser_scan.add_argument(
-        '--time',
-        type=int,
-        default=5,
-        help="Number of seconds to poll for devices. Default is 5."
-    )
-    args = parser.parse_args()
+
+def main():
+    """ Collects the command line arguments to then pass to the appropriate function (depending
+    on if the user wanted to scan or simply connect to a device).
+    """
+    args = _build_parser(sys.argv[1:]).parse_args()
 
     # starting to process arguments
     if args.mode == 'scan':
         asyncio.run(mug_find(args.time))
     else:
+        from bleak.exc import BleakDeviceNotFoundError # pylint: disable=import-outside-toplevel
+
         try:
             selected_arg = False
-            # Probably a better way of doing this, just wanted to ensure selected_arg
-            #   was populated appropriately for the given command.
-            if args.mug_command == 'set-temp-unit':
-                selected_arg = args.unit
-            elif args.mug_command == 'set-target-temp':
-                selected_arg = args.temp
-            asyncio.run(mug_control(args.id, args.mug_command, selected_arg))
+            if args.mug_command in _COMMAND_ARGS:
+                selected_arg = getattr(args, _COMMAND_ARGS[args.mug_command])
+            asyncio.run(mug_control(args.id, args.mug_command, selected_arg, args.unpair))
         except BleakDeviceNotFoundError:
             print(f'Unable to find Ember Mug with address {args.id}')
+        except KeyboardInterrupt:
+            # how the watch command is stopped
+            pass
 
 if __name__ == '__main__':
     main()